@@ -1,26 +1,102 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import re
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from hashlib import sha256
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Mapping, Sequence
 
+_COMMENT_RE = re.compile(r"\s+#.*$")
+
+# Requirements files at or above this size are memory-mapped when hashing
+# instead of being read into one big string.
+_MMAP_THRESHOLD = 64 * 1024
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from blake3 import blake3 as _fingerprint_hash
+
+    _FINGERPRINT_NAME = "blake3"
+except ImportError:
+    try:
+        from xxhash import xxh3_128 as _fingerprint_hash
+
+        _FINGERPRINT_NAME = "xxh3_128"
+    except ImportError:
+        from hashlib import sha256 as _fingerprint_hash
+
+        _FINGERPRINT_NAME = "sha256"
+
+
+@dataclass(slots=True)
+class _RegistryRow:
+    """In-memory registry record with the derived path strings precomputed."""
 
-@dataclass(frozen=True)
-class VenvRecord:
     name: str
-    path: Path
+    path_str: str
+    resolved_str: str
+    python_str: str
     requirements_hash: str | None
 
 
+class VenvRecord:
+    """Immutable registry entry for a managed venv; ``path`` is constructed
+    lazily."""
+
+    __slots__ = ("name", "requirements_hash", "_path_str", "_path")
+
+    def __init__(
+        self, name: str, path: Path | str, requirements_hash: str | None
+    ) -> None:
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "requirements_hash", requirements_hash)
+        object.__setattr__(self, "_path_str", os.fspath(path))
+        object.__setattr__(self, "_path", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"VenvRecord is immutable: cannot set {name!r}")
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            object.__setattr__(self, "_path", Path(self._path_str))
+        return self._path
+
+    def __repr__(self) -> str:
+        return (
+            f"VenvRecord(name={self.name!r}, path={self._path_str!r}, "
+            f"requirements_hash={self.requirements_hash!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VenvRecord):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self._path_str == other._path_str
+            and self.requirements_hash == other.requirements_hash
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, self._path_str, self.requirements_hash))
+
+
 class VirtualEnvManager:
     """Manage Windows virtual environments based on a base interpreter."""
 
     DEFAULT_BASE_DIR = Path("C:/venvs")
     DEFAULT_BASE_INTERPRETER = Path("C:/python-embed/python.exe")
+    REGISTRY_SCHEMA = 2
 
     def __init__(
         self,
@@ -36,12 +112,24 @@ class VirtualEnvManager:
 
         self.base_dir = Path(base_dir) if base_dir else self.DEFAULT_BASE_DIR
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Resolve once so every path derived from base_dir is absolute with
+        # symlinks followed, matching how records are stored at create time.
+        self.base_dir = self.base_dir.resolve()
 
         if registry_path:
             self.registry_path = Path(registry_path)
         else:
             self.registry_path = self.base_dir / ".venv_mgr" / "registry.json"
 
+        self._registry_cache: list[_RegistryRow] | None = None
+        self._registry_mtime: int | None = None
+        self._by_name: dict[str, _RegistryRow] = {}
+        self._by_resolved_path: dict[str, _RegistryRow] = {}
+
+        self.pkg_hash_cache_path = self.registry_path.parent / "pkg_hash_cache.json"
+        self._pkg_hash_cache: dict[str, list] | None = None
+        self._pkg_hash_cache_lock = threading.Lock()
+
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
         if not self.registry_path.exists():
             self._save_registry([])
@@ -53,6 +141,22 @@ class VirtualEnvManager:
         path: Path | str | None = None,
         requirements: Sequence[str] | Path | str | None = None,
     ) -> Path:
+        venv_path, requirements_hash = self._build_venv(
+            name, path=path, requirements=requirements
+        )
+
+        records = self._load_registry()
+        records.append(self._make_row(name, str(venv_path), requirements_hash))
+        self._save_registry(records)
+        return venv_path
+
+    def _build_venv(
+        self,
+        name: str,
+        *,
+        path: Path | str | None,
+        requirements: Sequence[str] | Path | str | None,
+    ) -> tuple[Path, str | None]:
         venv_path = Path(path) if path else self.base_dir / name
         venv_path = venv_path.resolve()
 
@@ -61,23 +165,54 @@ class VirtualEnvManager:
 
         self._run([str(self.base_interpreter), "-m", "venv", str(venv_path)])
 
-        if requirements:
-            self.install_requirements(venv_path, requirements)
-
         requirements_hash = None
         if requirements:
+            self.install_requirements(venv_path, requirements)
             requirements_hash = self._hash_requirements(requirements)
 
+        return venv_path, requirements_hash
+
+    def create_venvs(
+        self,
+        requirements_by_name: Mapping[str, Sequence[str] | Path | str | None],
+        *,
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """Create several venvs under ``base_dir``, one worker thread per venv.
+
+        The venv and pip subprocesses release the GIL, so independent venvs
+        build in parallel; the registry is updated once at the end.
+        """
+        if not requirements_by_name:
+            return []
+
+        venv_paths: dict[str, Path] = {}
+        for name in requirements_by_name:
+            venv_path = (self.base_dir / name).resolve()
+            if venv_path.exists():
+                raise FileExistsError(f"Venv already exists at: {venv_path}")
+            venv_paths[name] = venv_path
+
+        def build(name: str) -> tuple[str, str | None]:
+            venv_path = venv_paths[name]
+            requirements = requirements_by_name[name]
+            self._run([str(self.base_interpreter), "-m", "venv", str(venv_path)])
+            if requirements:
+                self.install_requirements(venv_path, requirements)
+                return name, self._hash_requirements(requirements)
+            return name, None
+
+        workers = max_workers or min(32, len(venv_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(build, requirements_by_name))
+
         records = self._load_registry()
-        records.append(
-            {
-                "name": name,
-                "path": str(venv_path),
-                "requirements_hash": requirements_hash,
-            }
-        )
+        for name, requirements_hash in results:
+            records.append(
+                self._make_row(name, str(venv_paths[name]), requirements_hash)
+            )
         self._save_registry(records)
-        return venv_path
+        return [venv_paths[name] for name in requirements_by_name]
 
     def get_or_create_venv(
         self,
@@ -86,38 +221,47 @@ class VirtualEnvManager:
         path: Path | str | None = None,
         requirements: Sequence[str] | Path | str | None = None,
     ) -> Path:
+        records = self._load_registry()
+        dirty = False
         if requirements:
-            existing = self.find_venvs_by_requirements(requirements)
-            if existing:
-                return existing[0]
-        return self.create_venv(name, path=path, requirements=requirements)
+            matches, dirty = self._match_requirements(
+                records, self._hash_requirements(requirements)
+            )
+            if matches:
+                if dirty:
+                    self._save_registry(records)
+                return matches[0]
+
+        venv_path, requirements_hash = self._build_venv(
+            name, path=path, requirements=requirements
+        )
+        records.append(self._make_row(name, str(venv_path), requirements_hash))
+        self._save_registry(records)
+        return venv_path
 
     def list_venvs(self) -> list[VenvRecord]:
-        records = []
-        for record in self._load_registry():
-            records.append(
-                VenvRecord(
-                    name=record["name"],
-                    path=Path(record["path"]),
-                    requirements_hash=record.get("requirements_hash"),
-                )
+        return [
+            VenvRecord(
+                name=row.name,
+                path=row.path_str,
+                requirements_hash=row.requirements_hash,
             )
-        return records
+            for row in self._load_registry()
+        ]
 
     def delete_venv(self, name_or_path: str | Path, *, remove_dir: bool = True) -> bool:
         target_path = Path(name_or_path)
         if not target_path.is_absolute():
-            target_path = (self.base_dir / target_path).resolve()
+            target_path = self.base_dir / target_path
 
         records = self._load_registry()
-        updated = [
-            record
-            for record in records
-            if Path(record["path"]).resolve() != target_path
-        ]
-        removed_from_registry = len(records) != len(updated)
+        canonical = self._canonical(target_path)
+        # The index is only a fast existence check; duplicate records can
+        # share a path, so removal filters the full list like the baseline.
+        removed_from_registry = canonical in self._by_resolved_path
         if removed_from_registry:
-            self._save_registry(updated)
+            records = [row for row in records if row.resolved_str != canonical]
+            self._save_registry(records)
 
         if remove_dir and target_path.exists():
             shutil.rmtree(target_path)
@@ -126,19 +270,25 @@ class VirtualEnvManager:
 
     def clear_all_venvs(self, *, remove_dirs: bool = True) -> list[Path]:
         records = self._load_registry()
-        removed_paths = [Path(record["path"]) for record in records]
+        removed_paths = [Path(row.path_str) for row in records]
         self._save_registry([])
 
-        if remove_dirs:
-            for venv_path in removed_paths:
-                if venv_path.exists():
-                    shutil.rmtree(venv_path)
+        if remove_dirs and removed_paths:
+            with ThreadPoolExecutor(
+                max_workers=min(32, len(removed_paths))
+            ) as executor:
+                for venv_path in removed_paths:
+                    if venv_path.exists():
+                        executor.submit(shutil.rmtree, venv_path, ignore_errors=True)
 
         return removed_paths
 
     def install_requirements(
         self, venv_path: Path | str, requirements: Sequence[str] | Path | str
     ) -> None:
+        if not isinstance(requirements, (str, Path)) and not requirements:
+            return
+
         venv_root = Path(venv_path)
         venv_python = self._venv_python(venv_root)
         log_path = venv_root / "pip-install.log"
@@ -153,12 +303,12 @@ class VirtualEnvManager:
                 return
             raise FileNotFoundError(f"Requirements file not found: {req_path}")
 
-        if not requirements:
-            return
-
+        # Dedupe, then sort so identical requirement sets produce identical
+        # pip invocations regardless of caller ordering.
+        specs = sorted(dict.fromkeys(requirements))
         self._run_pip_install(
             log_path,
-            [str(venv_python), "-m", "pip", "install", *requirements],
+            [str(venv_python), "-m", "pip", "install", *specs],
         )
 
     def install_wheels_from_dir(
@@ -168,7 +318,7 @@ class VirtualEnvManager:
         if not wheels_path.exists():
             raise FileNotFoundError(f"Wheels directory not found: {wheels_path}")
 
-        wheel_files = sorted(wheels_path.rglob("*.whl"))
+        wheel_files = sorted(self._iter_wheels(str(wheels_path)))
         if not wheel_files:
             return []
 
@@ -181,20 +331,44 @@ class VirtualEnvManager:
             log_path = venv_path / "pip-install.log"
         self._run_pip_install(
             log_path,
-            [str(venv_python), "-m", "pip", "install", *[str(p) for p in wheel_files]],
+            [str(venv_python), "-m", "pip", "install", *wheel_files],
         )
-        return wheel_files
+        return [Path(wheel_file) for wheel_file in wheel_files]
+
+    def _iter_wheels(self, directory: str) -> Iterator[str]:
+        # os.scandir keeps the walk on plain strings; Path objects are only
+        # built for the caller-facing return value.
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_wheels(entry.path)
+                elif entry.name.endswith(".whl"):
+                    yield entry.path
 
     def list_installed_packages(self, name_or_path: Path | str) -> list[str]:
         venv_python = self.get_python_path(name_or_path)
-        output = self._run(
-            [str(venv_python), "-m", "pip", "freeze"], capture_output=True
-        )
-        return [line.strip() for line in output.splitlines() if line.strip()]
+        command = [str(venv_python), "-m", "pip", "freeze"]
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        ) as process:
+            packages = [line.strip() for line in process.stdout if line.strip()]
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+        return packages
 
     def get_python_path(self, name_or_path: Path | str) -> Path:
-        venv_path = self._resolve_venv_path(name_or_path)
-        return self._venv_python(venv_path)
+        venv_path = Path(name_or_path)
+        if not venv_path.is_absolute() and not venv_path.exists():
+            self._load_registry()
+            row = self._by_name.get(str(name_or_path))
+            if row is not None:
+                # Interpreter path was joined once when the row was built.
+                return Path(row.python_str)
+        return self._venv_python(self._resolve_venv_path(name_or_path))
 
     def copy_pip_install_log(
         self, name_or_path: Path | str, output_dir: Path | str
@@ -213,53 +387,137 @@ class VirtualEnvManager:
     def find_venvs_by_requirements(
         self, requirements: Sequence[str] | Path | str
     ) -> list[Path]:
-        target_hash = self._hash_requirements(requirements)
-        matches: list[Path] = []
-
         records = self._load_registry()
-        for record in records:
-            record_hash = record.get("requirements_hash")
-            record_path = Path(record["path"])
-            if record_hash is None and record_path.exists():
-                record_hash = self._hash_installed_packages(record_path)
-                record["requirements_hash"] = record_hash
-            if record_hash == target_hash:
-                matches.append(record_path)
-
-        self._save_registry(records)
+        matches, dirty = self._match_requirements(
+            records, self._hash_requirements(requirements)
+        )
+        if dirty:
+            self._save_registry(records)
         return matches
 
+    def _match_requirements(
+        self, records: list[_RegistryRow], target_hash: str
+    ) -> tuple[list[Path], bool]:
+        # Pass 1: precomputed hashes only. Any hit here means we never have
+        # to spawn pip freeze for the unhashed records.
+        matches = [
+            Path(row.path_str)
+            for row in records
+            if row.requirements_hash == target_hash
+        ]
+        if matches:
+            return matches, False
+
+        # Pass 2: backfill missing hashes, one pip freeze per venv run in
+        # parallel since each subprocess is independent.
+        pending: list[tuple[_RegistryRow, Path]] = []
+        for row in records:
+            if row.requirements_hash is not None:
+                continue
+            row_path = Path(row.path_str)
+            if row_path.exists():
+                pending.append((row, row_path))
+        if not pending:
+            return matches, False
+
+        with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+            hashes = executor.map(
+                self._hash_installed_packages, [path for _, path in pending]
+            )
+            for (row, row_path), row_hash in zip(pending, hashes):
+                row.requirements_hash = row_hash
+                if row_hash == target_hash:
+                    matches.append(row_path)
+
+        return matches, True
+
     def _hash_requirements(self, requirements: Sequence[str] | Path | str) -> str:
         if isinstance(requirements, (str, Path)):
             req_path = Path(requirements)
             if req_path.exists():
+                if req_path.stat().st_size >= _MMAP_THRESHOLD:
+                    return self._hash_requirements_file(req_path)
                 lines = req_path.read_text(encoding="utf-8").splitlines()
             else:
                 lines = [str(requirements)]
         else:
             lines = list(requirements)
 
-        normalized = [self._normalize_requirement(line) for line in lines]
-        normalized = [line for line in normalized if line]
-        normalized.sort()
-        joined = "\n".join(normalized)
-        return sha256(joined.encode("utf-8")).hexdigest()
+        return self._hash_lines(lines)
+
+    def _hash_requirements_file(self, req_path: Path) -> str:
+        # Memory-map large lock files and decode line by line, so only the
+        # normalized line strings are ever materialized.
+        with open(req_path, "rb") as req_file:
+            with mmap.mmap(
+                req_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                lines = (raw.decode("utf-8") for raw in iter(mapped.readline, b""))
+                return self._hash_lines(lines)
 
     def _hash_installed_packages(self, venv_path: Path) -> str:
-        packages = self.list_installed_packages(venv_path)
-        normalized = [self._normalize_requirement(line) for line in packages]
-        normalized = [line for line in normalized if line]
-        normalized.sort()
-        joined = "\n".join(normalized)
-        return sha256(joined.encode("utf-8")).hexdigest()
-
-    def _normalize_requirement(self, line: str) -> str:
-        line = line.strip()
-        if not line or line.startswith("#"):
-            return ""
-        if " #" in line:
-            line = line.split(" #", 1)[0]
-        return line.lower()
+        # Key the cache on the venv path and its site-packages mtime so the
+        # pip freeze subprocess only runs when the installed set changed.
+        site_packages = venv_path / "Lib" / "site-packages"
+        try:
+            site_mtime = site_packages.stat().st_mtime_ns
+        except OSError:
+            return self._hash_lines(self.list_installed_packages(venv_path))
+
+        cache_key = str(venv_path)
+        cache = self._load_pkg_hash_cache()
+        entry = cache.get(cache_key)
+        if entry is not None and entry[0] == site_mtime:
+            return entry[1]
+
+        package_hash = self._hash_lines(self.list_installed_packages(venv_path))
+        with self._pkg_hash_cache_lock:
+            cache[cache_key] = [site_mtime, package_hash]
+            if orjson is not None:
+                payload = orjson.dumps(cache)
+            else:
+                payload = json.dumps(cache).encode("utf-8")
+            self.pkg_hash_cache_path.write_bytes(payload)
+        return package_hash
+
+    def _load_pkg_hash_cache(self) -> dict[str, list]:
+        if self._pkg_hash_cache is None:
+            # The backfill pass hashes venvs from worker threads; take the
+            # lock so only one thread materializes the shared dict.
+            with self._pkg_hash_cache_lock:
+                if self._pkg_hash_cache is None:
+                    try:
+                        content = self.pkg_hash_cache_path.read_bytes()
+                        self._pkg_hash_cache = (
+                            orjson.loads(content)
+                            if orjson is not None
+                            else json.loads(content)
+                        )
+                    except (OSError, ValueError):
+                        self._pkg_hash_cache = {}
+        return self._pkg_hash_cache
+
+    def _hash_lines(self, lines: Iterable[str]) -> str:
+        hasher = _fingerprint_hash()
+        for line in sorted(self._normalize_all(lines)):
+            hasher.update(line.encode("utf-8"))
+            hasher.update(b"\n")
+        return hasher.hexdigest()
+
+    def _normalize_all(self, lines: Iterable[str]) -> list[str]:
+        sub = _COMMENT_RE.sub
+        normalized = [sub("", line).strip().lower() for line in lines]
+        return [line for line in normalized if line and not line.startswith("#")]
+
+    def _canonical(self, path: Path | str) -> str:
+        """Lexically normalized, case-folded path string for comparisons.
+
+        Registry paths are recorded ``resolve()``d and ``base_dir`` is
+        resolved once at init, so ``abspath`` plus ``normcase`` makes both
+        sides of a comparison absolute without a ``resolve()`` syscall per
+        path.
+        """
+        return os.path.normcase(os.path.abspath(os.fspath(path)))
 
     def _venv_python(self, venv_path: Path) -> Path:
         return venv_path / "Scripts" / "python.exe"
@@ -270,30 +528,115 @@ class VirtualEnvManager:
             return venv_path
 
         name = str(name_or_path)
-        for record in self._load_registry():
-            if record["name"] == name:
-                return Path(record["path"])
+        self._load_registry()
+        row = self._by_name.get(name)
+        if row is not None:
+            return Path(row.path_str)
 
         return (self.base_dir / name).resolve()
 
-    def _load_registry(self) -> list[dict[str, str | None]]:
-        content = self.registry_path.read_text(encoding="utf-8")
-        if not content.strip():
-            return []
-        return json.loads(content)
+    def _make_row(
+        self, name: str, path_str: str, requirements_hash: str | None
+    ) -> _RegistryRow:
+        # Canonical and interpreter path strings are derived once here so the
+        # hot lookups stay pure attribute access.
+        return _RegistryRow(
+            name=name,
+            path_str=path_str,
+            resolved_str=self._canonical(path_str),
+            python_str=os.path.join(path_str, "Scripts", "python.exe"),
+            requirements_hash=requirements_hash,
+        )
 
-    def _save_registry(self, records: Iterable[dict[str, str | None]]) -> None:
-        payload = json.dumps(list(records), indent=2)
-        self.registry_path.write_text(payload + "\n", encoding="utf-8")
+    def _load_registry(self) -> list[_RegistryRow]:
+        mtime = self.registry_path.stat().st_mtime_ns
+        if self._registry_cache is not None and self._registry_mtime == mtime:
+            return self._registry_cache
 
-    def _run(self, command: Sequence[str], *, capture_output: bool = False) -> str:
-        result = subprocess.run(
-            command,
-            check=True,
-            text=True,
-            capture_output=capture_output,
-        )
-        return result.stdout if capture_output else ""
+        content = self.registry_path.read_bytes()
+        if not content.strip():
+            venvs = []
+        else:
+            payload = orjson.loads(content) if orjson is not None else json.loads(content)
+            if isinstance(payload, list):
+                # Legacy schema 1: a bare list with sha256 hashes. Drop the
+                # hashes so they are recomputed lazily with the new algorithm.
+                venvs = payload
+                for venv in venvs:
+                    venv["requirements_hash"] = None
+            else:
+                venvs = payload.get("venvs", [])
+                # A registry written by another schema or another hash
+                # algorithm (e.g. a host without blake3) carries hashes that
+                # can never match ours; drop them for lazy recompute.
+                if (
+                    payload.get("schema") != self.REGISTRY_SCHEMA
+                    or payload.get("hash") != _FINGERPRINT_NAME
+                ):
+                    for venv in venvs:
+                        venv["requirements_hash"] = None
+
+        records = [
+            self._make_row(venv["name"], venv["path"], venv.get("requirements_hash"))
+            for venv in venvs
+        ]
+        self._registry_cache = records
+        self._registry_mtime = mtime
+        self._index_records(records)
+        return records
+
+    def _index_records(self, records: list[_RegistryRow]) -> None:
+        by_name: dict[str, _RegistryRow] = {}
+        by_resolved_path: dict[str, _RegistryRow] = {}
+        # First-wins on duplicates, matching the baseline linear scans.
+        for row in records:
+            by_name.setdefault(row.name, row)
+            by_resolved_path.setdefault(row.resolved_str, row)
+        self._by_name = by_name
+        self._by_resolved_path = by_resolved_path
+
+    def _save_registry(self, records: Iterable[_RegistryRow]) -> None:
+        records = list(records)
+        venvs = [
+            {
+                "name": row.name,
+                "path": row.path_str,
+                "requirements_hash": row.requirements_hash,
+            }
+            for row in records
+        ]
+        document = {
+            "schema": self.REGISTRY_SCHEMA,
+            "hash": _FINGERPRINT_NAME,
+            "venvs": venvs,
+        }
+        if orjson is not None:
+            payload = orjson.dumps(
+                document, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            )
+        else:
+            payload = (json.dumps(document, indent=2) + "\n").encode("utf-8")
+
+        # Write to a sibling temp file and swap it in atomically so a crash
+        # mid-write can never leave a truncated registry behind. O_BINARY
+        # keeps the Windows CRT from translating newlines in the payload.
+        tmp_path = str(self.registry_path) + ".tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.registry_path)
+        self._registry_cache = records
+        self._registry_mtime = self.registry_path.stat().st_mtime_ns
+        self._index_records(records)
+
+    def _run(self, command: Sequence[str]) -> None:
+        subprocess.run(command, check=True, text=True)
 
     def _run_pip_install(self, log_path: Path, command: Sequence[str]) -> None:
         result = subprocess.run(